@@ -11,6 +11,7 @@ from .config import (
     OUTPUT_DIR,
     KimiConfig,
     StockScreenerConfig,
+    BatchConfig,
     ReportTemplates,
     CategoryConfig,
     NamingConfig,
@@ -21,6 +22,7 @@ from .content_parser import ContentParser, content_parser, ParsedContent
 from .analyzer import NewsAnalyzer, news_analyzer, AnalysisResult
 from .stock_screener import StockScreener, stock_screener, StockRecommendation
 from .report_generator import ReportGenerator, report_generator
+from .batch import analyze_all, analyze_files
 
 
 __all__ = [
@@ -31,6 +33,7 @@ __all__ = [
     "OUTPUT_DIR",
     "KimiConfig",
     "StockScreenerConfig",
+    "BatchConfig",
     "ReportTemplates",
     "CategoryConfig",
     "NamingConfig",
@@ -52,4 +55,7 @@ __all__ = [
     # 报告生成
     "ReportGenerator",
     "report_generator",
+    # 批量分析
+    "analyze_all",
+    "analyze_files",
 ]
@@ -7,14 +7,19 @@ AI信息分析系统 - 信息分析模块
 - 关键信息提取
 """
 
+import heapq
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Dict, Iterable, List, Tuple
 
 from .content_parser import ParsedContent
+from .keyword_matcher import KeywordMatcher
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """分析结果"""
     
@@ -28,6 +33,18 @@ class AnalysisResult:
     importance: str  # high, medium, low
 
 
+@dataclass
+class _KeywordHits:
+    """一次扫描得到的关键词命中情况"""
+    
+    # 各分组的关键词出现次数（同一关键词多次出现累计计数）
+    positive: int = 0
+    negative: int = 0
+    categories: Counter = field(default_factory=Counter)
+    # 情感关键词命中：(结束位置, 关键词)
+    sentiment_hits: List[Tuple[int, str]] = field(default_factory=list)
+
+
 class NewsAnalyzer:
     """新闻分析器"""
     
@@ -56,6 +73,36 @@ class NewsAnalyzer:
         "国际财经": ["美股", "港股", "外资", "汇率", "国际"],
     }
     
+    # 句子分隔符
+    _SENTENCE_DELIMITER = re.compile(r'[。！？\n]')
+    
+    # 情感极端性（最多2分）与类别加权（最多1分）对重要性评分的最大贡献
+    _MAX_CONTENT_IMPORTANCE = 3
+    
+    # 股票代码首位 -> 市场（其余情况归为北交所）
+    _MARKET_BY_FIRST_CHAR = {
+        "6": "上海",
+        "0": "深圳",
+        "3": "深圳",
+    }
+    
+    def __init__(self):
+        """初始化分析器，预先构建关键词匹配自动机"""
+        # 关键词 -> [(分组, 值)]，同一关键词可能同时属于多个分组
+        keyword_tags = defaultdict(list)
+        for kw in self.POSITIVE_KEYWORDS:
+            keyword_tags[kw].append(("pos", kw))
+        for kw in self.NEGATIVE_KEYWORDS:
+            keyword_tags[kw].append(("neg", kw))
+        for category, keywords in self.CATEGORY_KEYWORDS.items():
+            for kw in keywords:
+                keyword_tags[kw].append(("cat", category))
+                
+        self._keyword_tags: Dict[str, List[Tuple[str, str]]] = dict(
+            keyword_tags
+        )
+        self._matcher = KeywordMatcher(self._keyword_tags)
+    
     def analyze(self, parsed_content: ParsedContent) -> AnalysisResult:
         """
         分析解析后的内容
@@ -67,31 +114,33 @@ class NewsAnalyzer:
             分析结果
         """
         content = parsed_content.content
+        stocks = parsed_content.stocks_mentioned
+        
+        # 一次扫描收集全部关键词命中
+        hits = self._scan_keywords(content)
         
         # 情感分析
-        sentiment, score = self._analyze_sentiment(content)
+        sentiment, score = self._analyze_sentiment(hits)
         
         # 分类
-        category = self._classify_news(content)
+        category = self._classify_news(hits)
         
         # 提取关键点
-        key_points = self._extract_key_points(content)
+        key_points = self._extract_key_points(
+            content,
+            hits.sentiment_hits
+        )
         
         # 生成摘要
-        summary = self._generate_summary(
-            parsed_content.title,
-            key_points
-        )
+        summary = self._generate_summary(parsed_content.title, key_points)
         
         # 关联股票信息
-        related_stocks = self._enrich_stock_info(
-            parsed_content.stocks_mentioned
-        )
+        related_stocks = self._enrich_stock_info(stocks)
         
         # 判断重要性
         importance = self._assess_importance(
             score, 
-            len(parsed_content.stocks_mentioned),
+            len(stocks),
             category
         )
         
@@ -101,14 +150,79 @@ class NewsAnalyzer:
             sentiment_score=score,
             key_points=key_points,
             related_stocks=related_stocks,
-            related_industries=parsed_content.industries_mentioned,
+            related_industries=list(parsed_content.industries_mentioned),
             category=category,
             importance=importance,
         )
     
+    def analyze_batch(
+        self, 
+        parsed_contents: Iterable[ParsedContent]
+    ) -> List[AnalysisResult]:
+        """
+        批量分析解析后的内容
+        
+        Args:
+            parsed_contents: 解析后的内容列表
+            
+        Returns:
+            分析结果列表，顺序与输入一致
+        """
+        analyze = self.analyze
+        return [analyze(parsed) for parsed in parsed_contents]
+    
+    def may_have_importance(
+        self, 
+        parsed_content: ParsedContent,
+        importance: str
+    ) -> bool:
+        """
+        不做完整分析，判断内容的重要性是否可能为指定等级
+        
+        重要性评分中只有股票数量一项不依赖正文分析，情感极端性和
+        类别加权合计最多加3分，由此得到评分的取值范围。
+        
+        Args:
+            parsed_content: 解析后的内容
+            importance: 重要性等级（high/medium/low）
+            
+        Returns:
+            返回False时分析结果一定不是该等级
+        """
+        base = self._stock_count_score(len(parsed_content.stocks_mentioned))
+        return any(
+            self._importance_level(score) == importance
+            for score in range(base, base + self._MAX_CONTENT_IMPORTANCE + 1)
+        )
+    
+    def _scan_keywords(self, content: str) -> _KeywordHits:
+        """扫描一遍内容，按分组收集关键词命中"""
+        hits = _KeywordHits()
+        
+        # 热循环中只使用局部变量，避免每次命中都查找属性
+        keyword_tags = self._keyword_tags
+        categories = hits.categories
+        sentiment_hits = hits.sentiment_hits
+        positive = negative = 0
+        
+        for end, kw in self._matcher.iter(content):
+            for group, value in keyword_tags[kw]:
+                if group == "pos":
+                    positive += 1
+                    sentiment_hits.append((end, kw))
+                elif group == "neg":
+                    negative += 1
+                    sentiment_hits.append((end, kw))
+                else:
+                    categories[value] += 1
+                    
+        hits.positive = positive
+        hits.negative = negative
+        return hits
+    
     def _analyze_sentiment(
         self, 
-        content: str
+        hits: _KeywordHits
     ) -> Tuple[str, float]:
         """
         分析内容情感倾向
@@ -116,12 +230,8 @@ class NewsAnalyzer:
         Returns:
             (情感标签, 情感分数)
         """
-        positive_count = sum(
-            1 for kw in self.POSITIVE_KEYWORDS if kw in content
-        )
-        negative_count = sum(
-            1 for kw in self.NEGATIVE_KEYWORDS if kw in content
-        )
+        positive_count = hits.positive
+        negative_count = hits.negative
         
         total = positive_count + negative_count
         if total == 0:
@@ -138,13 +248,14 @@ class NewsAnalyzer:
             
         return sentiment, score
     
-    def _classify_news(self, content: str) -> str:
+    def _classify_news(self, hits: _KeywordHits) -> str:
         """对新闻进行分类"""
         max_score = 0
         best_category = "其他"
         
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in content)
+        # 按声明顺序遍历，得分相同时保留靠前的类别
+        for category in self.CATEGORY_KEYWORDS:
+            score = hits.categories[category]
             if score > max_score:
                 max_score = score
                 best_category = category
@@ -154,31 +265,44 @@ class NewsAnalyzer:
     def _extract_key_points(
         self, 
         content: str, 
+        sentiment_hits: List[Tuple[int, str]],
         max_points: int = 5
     ) -> List[str]:
-        """提取关键要点"""
-        # 按句子分割
-        sentences = re.split(r'[。！？\n]', content)
+        """
+        提取关键要点
+        
+        Args:
+            content: 正文内容
+            sentiment_hits: 情感关键词命中 (结束位置, 关键词)
+            max_points: 最多返回的要点数
+        """
+        # 句子分隔符位置：第i句位于第i-1个与第i个分隔符之间
+        boundaries = [
+            m.start() for m in self._SENTENCE_DELIMITER.finditer(content)
+        ]
         
-        # 过滤和评分
+        # 将关键词命中归入所在句子，句子得分为不同关键词个数
+        sentence_keywords = defaultdict(set)
+        for end, kw in sentiment_hits:
+            sentence_keywords[bisect_right(boundaries, end)].add(kw)
+        
+        # 过滤和评分（只切出有命中的句子）
         scored_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 10 or len(sentence) > 100:
+        for idx in sorted(sentence_keywords):
+            start = boundaries[idx - 1] + 1 if idx else 0
+            stop = boundaries[idx] if idx < len(boundaries) else len(content)
+            # 去除空白只会变短，原始长度已不足时无需切片
+            if stop - start < 10:
                 continue
-                
-            # 根据关键词打分
-            score = 0
-            for kw in self.POSITIVE_KEYWORDS + self.NEGATIVE_KEYWORDS:
-                if kw in sentence:
-                    score += 1
-                    
-            if score > 0:
-                scored_sentences.append((sentence, score))
+            sentence = content[start:stop].strip()
+            length = len(sentence)
+            if length < 10 or length > 100:
+                continue
+            scored_sentences.append((sentence, len(sentence_keywords[idx])))
         
         # 排序并返回前N个
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        return [s[0] for s in scored_sentences[:max_points]]
+        top = heapq.nlargest(max_points, scored_sentences, key=itemgetter(1))
+        return [s[0] for s in top]
     
     def _generate_summary(
         self, 
@@ -194,31 +318,26 @@ class NewsAnalyzer:
     
     def _enrich_stock_info(
         self, 
-        stock_codes: List[str]
+        stock_codes: Iterable[str]
     ) -> List[Dict[str, str]]:
         """
         丰富股票信息
         
         注意：这里是模拟数据，实际应用中应调用股票API
         """
-        stocks = []
-        for code in stock_codes:
-            market = self._get_market_by_code(code)
-            stocks.append({
+        market_of = self._get_market_by_code
+        return [
+            {
                 "code": code,
-                "market": market,
+                "market": market_of(code),
                 "name": f"股票{code}",  # 实际应查询股票名称
-            })
-        return stocks
+            }
+            for code in stock_codes
+        ]
     
     def _get_market_by_code(self, code: str) -> str:
         """根据股票代码判断市场"""
-        if code.startswith("6"):
-            return "上海"
-        elif code.startswith("0") or code.startswith("3"):
-            return "深圳"
-        else:
-            return "北交所"
+        return self._MARKET_BY_FIRST_CHAR.get(code[:1], "北交所")
     
     def _assess_importance(
         self,
@@ -236,15 +355,24 @@ class NewsAnalyzer:
             score += 1
             
         # 涉及股票数量
-        if stock_count >= 3:
-            score += 2
-        elif stock_count >= 1:
-            score += 1
+        score += self._stock_count_score(stock_count)
             
         # 类别加权
         if category in ["宏观政策", "公司公告"]:
             score += 1
             
+        return self._importance_level(score)
+    
+    def _stock_count_score(self, stock_count: int) -> int:
+        """涉及股票数量对重要性评分的贡献"""
+        if stock_count >= 3:
+            return 2
+        elif stock_count >= 1:
+            return 1
+        return 0
+    
+    def _importance_level(self, score: int) -> str:
+        """根据重要性评分确定等级"""
         if score >= 4:
             return "high"
         elif score >= 2:
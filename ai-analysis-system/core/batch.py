@@ -0,0 +1,169 @@
+"""
+AI信息分析系统 - 批量分析模块
+
+本模块负责批量解析和分析文件。各文件的分析互不依赖，
+文件较多时分发到多个进程并行执行，绕开GIL的限制。
+分析结果在主进程中按文件缓存，同一次运行中多个技能处理
+相同文件时不必重复分析。
+"""
+
+import os
+from collections import OrderedDict
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .analyzer import AnalysisResult, news_analyzer
+from .config import BatchConfig
+from .content_parser import content_parser
+
+
+# (路径, 修改时间, 大小) -> 分析结果，LRU淘汰
+_result_cache: "OrderedDict[Tuple[str, int, int], AnalysisResult]" = OrderedDict()
+
+
+def analyze_all(
+    file_paths: List[Path],
+    max_workers: Optional[int] = None
+) -> List[AnalysisResult]:
+    """
+    批量解析并分析文件
+    
+    Args:
+        file_paths: 文件路径列表
+        max_workers: 进程数，默认使用BatchConfig.MAX_WORKERS
+        
+    Returns:
+        分析结果列表，顺序与输入一致，处理出错的文件会被跳过
+    """
+    return [
+        r for r in analyze_files(file_paths, max_workers)
+        if r is not None
+    ]
+
+
+def analyze_files(
+    file_paths: List[Path],
+    max_workers: Optional[int] = None,
+    importance: Optional[str] = None
+) -> List[Optional[AnalysisResult]]:
+    """
+    批量解析并分析文件，结果与输入逐一对应
+    
+    Args:
+        file_paths: 文件路径列表
+        max_workers: 进程数，默认使用BatchConfig.MAX_WORKERS
+        importance: 只关心该重要性等级时传入，解析后即可判定不可能
+            达到该等级的文件不做分析
+        
+    Returns:
+        分析结果列表，与输入一一对应，处理出错或被跳过的文件对应None
+    """
+    file_paths = list(file_paths)
+    keys = [_cache_key(file_path) for file_path in file_paths]
+    
+    # 先查缓存，只分析未命中的文件
+    results: List[Optional[AnalysisResult]] = []
+    misses = []
+    for index, key in enumerate(keys):
+        result = _result_cache.get(key) if key is not None else None
+        if result is None:
+            misses.append(index)
+        else:
+            _result_cache.move_to_end(key)
+        results.append(result)
+    
+    if not misses:
+        return results
+    
+    fresh = _analyze_paths(
+        [file_paths[index] for index in misses],
+        max_workers,
+        importance
+    )
+    for index, result in zip(misses, fresh):
+        results[index] = result
+        key = keys[index]
+        if result is not None and key is not None:
+            _result_cache[key] = result
+            
+    while len(_result_cache) > BatchConfig.RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+        
+    return results
+
+
+def _cache_key(file_path: Path) -> Optional[Tuple[str, int, int]]:
+    """文件的缓存键，文件被修改后键随之变化；无法访问时返回None"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return os.fspath(file_path), stat.st_mtime_ns, stat.st_size
+
+
+def _analyze_paths(
+    file_paths: List[Path],
+    max_workers: Optional[int],
+    importance: Optional[str]
+) -> List[Optional[AnalysisResult]]:
+    """分析文件列表，文件较多时分发到多个进程"""
+    if len(file_paths) < BatchConfig.PARALLEL_THRESHOLD:
+        return _analyze_chunk(file_paths, importance)
+    
+    # 进程池会连带导入multiprocessing等模块，只在真正并行时才导入
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # 每个子进程一次处理一组文件，组内批量解析和分析
+    size = BatchConfig.CHUNK_SIZE
+    chunks = [
+        file_paths[i:i + size]
+        for i in range(0, len(file_paths), size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=max_workers or BatchConfig.MAX_WORKERS
+    ) as executor:
+        return list(chain.from_iterable(executor.map(
+            partial(_analyze_chunk, importance=importance),
+            chunks
+        )))
+
+
+def _analyze_chunk(
+    file_paths: List[Path],
+    importance: Optional[str] = None
+) -> List[Optional[AnalysisResult]]:
+    """批量解析并分析一组文件（需为模块级函数以便子进程调用）"""
+    try:
+        parsed_contents = content_parser.parse_files(file_paths)
+        if importance is None:
+            return news_analyzer.analyze_batch(parsed_contents)
+        return [
+            news_analyzer.analyze(parsed)
+            if news_analyzer.may_have_importance(parsed, importance)
+            else None
+            for parsed in parsed_contents
+        ]
+    except Exception:
+        # 组内有文件出错时逐个重试，只跳过出错的文件
+        return [
+            _analyze_one(file_path, importance)
+            for file_path in file_paths
+        ]
+
+
+def _analyze_one(
+    file_path: Path,
+    importance: Optional[str] = None
+) -> Optional[AnalysisResult]:
+    """解析并分析单个文件"""
+    try:
+        parsed = content_parser.parse_file(file_path)
+        if (importance is not None
+                and not news_analyzer.may_have_importance(parsed, importance)):
+            return None
+        return news_analyzer.analyze(parsed)
+    except Exception as e:
+        print(f"处理文件 {file_path} 时出错: {e}")
+        return None
@@ -80,6 +80,26 @@ class StockScreenerConfig:
     ]
 
 
+# ============================================================
+# 批量处理配置
+# ============================================================
+
+class BatchConfig:
+    """批量处理配置"""
+    
+    # 文件数达到该值才启用多进程，少量文件串行处理更快
+    PARALLEL_THRESHOLD = 16
+    
+    # 进程数（None表示使用CPU核数）
+    MAX_WORKERS = None
+    
+    # 每次分发给子进程的文件数
+    CHUNK_SIZE = 8
+    
+    # 按(路径, 修改时间, 大小)缓存的分析结果条数
+    RESULT_CACHE_SIZE = 1024
+
+
 # ============================================================
 # 报告模板配置
 # ============================================================
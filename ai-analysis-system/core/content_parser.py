@@ -5,13 +5,17 @@ AI信息分析系统 - 内容解析模块
 """
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from .file_manager import file_manager
+from .keyword_matcher import KeywordMatcher
 
-@dataclass
+
+@dataclass(slots=True)
 class ParsedContent:
     """解析后的内容结构"""
     
@@ -37,6 +41,9 @@ class ContentParser:
         r'(?:[\)\）])?'
     )
     
+    # --- ... --- 格式的YAML头
+    FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+    
     # 常见行业关键词
     INDUSTRY_KEYWORDS = [
         "新能源", "光伏", "锂电", "储能",
@@ -51,6 +58,12 @@ class ContentParser:
         "通信", "5G", "物联网",
     ]
     
+    # 行业关键词匹配器（类加载时构建一次）
+    _industry_matcher = KeywordMatcher(INDUSTRY_KEYWORDS)
+    
+    # 批量解析时拼接各文件正文的分隔符，不会出现在股票代码或行业关键词中
+    _BATCH_SEPARATOR = "\x1e"
+    
     def parse_file(self, file_path: Path) -> ParsedContent:
         """
         解析Markdown文件
@@ -61,7 +74,7 @@ class ContentParser:
         Returns:
             解析后的内容结构
         """
-        content = file_path.read_text(encoding="utf-8")
+        content = file_manager.read_file(file_path)
         return self.parse_content(content, file_path.name)
     
     def parse_content(
@@ -79,12 +92,85 @@ class ContentParser:
         Returns:
             解析后的内容结构
         """
-        # 解析YAML前置元数据
-        metadata = self._parse_frontmatter(content)
+        # 解析YAML前置元数据，并得到移除YAML头部后的正文
+        metadata, body = self._split_frontmatter(content)
+        
+        # 提取股票代码
+        stocks = self._extract_stock_codes(body)
+        
+        # 提取行业关键词
+        industries = self._extract_industries(body)
+        
+        return self._build_parsed_content(
+            body,
+            filename,
+            metadata,
+            stocks,
+            industries
+        )
+    
+    def parse_files(self, file_paths: List[Path]) -> List[ParsedContent]:
+        """
+        批量解析Markdown文件
+        
+        各文件正文用分隔符拼接后，股票代码正则和行业关键词匹配都只
+        扫描一遍，再按偏移量把命中结果归还给所属文件。
+        
+        Args:
+            file_paths: 文件路径列表
+            
+        Returns:
+            与输入顺序一致的解析结果列表
+        """
+        metadatas = []
+        bodies = []
+        for file_path in file_paths:
+            content = file_manager.read_file(file_path)
+            metadata, body = self._split_frontmatter(content)
+            metadatas.append(metadata)
+            bodies.append(body)
+        
+        # 各正文在拼接文本中的起始位置
+        starts = []
+        offset = 0
+        for body in bodies:
+            starts.append(offset)
+            offset += len(body) + len(self._BATCH_SEPARATOR)
+        combined = self._BATCH_SEPARATOR.join(bodies)
         
-        # 移除YAML头部后的正文
-        body = self._remove_frontmatter(content)
+        # 股票代码：dict去重并保持顺序
+        stocks = [{} for _ in bodies]
+        for match in self.STOCK_CODE_PATTERN.finditer(combined):
+            index = bisect_right(starts, match.start(1)) - 1
+            stocks[index].setdefault(match.group(1))
         
+        # 行业关键词
+        found = [set() for _ in bodies]
+        for end, keyword in self._industry_matcher.iter(combined):
+            found[bisect_right(starts, end) - 1].add(keyword)
+        
+        return [
+            self._build_parsed_content(
+                body,
+                file_path.name,
+                metadata,
+                list(codes),
+                [kw for kw in self.INDUSTRY_KEYWORDS if kw in keywords],
+            )
+            for file_path, metadata, body, codes, keywords in zip(
+                file_paths, metadatas, bodies, stocks, found
+            )
+        ]
+    
+    def _build_parsed_content(
+        self,
+        body: str,
+        filename: str,
+        metadata: Dict[str, str],
+        stocks: List[str],
+        industries: List[str]
+    ) -> ParsedContent:
+        """由正文、元数据和提取结果组装解析结构"""
         # 提取标题
         title = self._extract_title(body) or filename
         
@@ -97,12 +183,6 @@ class ContentParser:
         source = metadata.get("source", "")
         category = metadata.get("category", "")
         
-        # 提取股票代码
-        stocks = self._extract_stock_codes(body)
-        
-        # 提取行业关键词
-        industries = self._extract_industries(body)
-        
         return ParsedContent(
             title=title,
             date=date,
@@ -114,35 +194,28 @@ class ContentParser:
             industries_mentioned=industries,
         )
     
-    def _parse_frontmatter(self, content: str) -> Dict[str, str]:
-        """解析YAML前置元数据"""
-        metadata = {}
-        
-        # 匹配 --- ... --- 格式的YAML头
-        match = re.match(
-            r'^---\s*\n(.*?)\n---\s*\n',
-            content,
-            re.DOTALL
-        )
+    def _split_frontmatter(
+        self, 
+        content: str
+    ) -> Tuple[Dict[str, str], str]:
+        """
+        拆分YAML前置元数据与正文
         
-        if match:
-            yaml_content = match.group(1)
-            # 简单解析YAML（键: 值）
-            for line in yaml_content.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    metadata[key.strip()] = value.strip()
-                    
-        return metadata
-    
-    def _remove_frontmatter(self, content: str) -> str:
-        """移除YAML前置元数据"""
-        return re.sub(
-            r'^---\s*\n.*?\n---\s*\n',
-            '',
-            content,
-            flags=re.DOTALL
-        )
+        Returns:
+            (元数据字典, 移除YAML头部后的正文)
+        """
+        match = self.FRONTMATTER_PATTERN.match(content)
+        if not match:
+            return {}, content
+            
+        metadata = {}
+        # 简单解析YAML（键: 值）
+        for line in match.group(1).split('\n'):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                metadata[key.strip()] = value.strip()
+                
+        return metadata, content[match.end():]
     
     def _extract_title(self, content: str) -> Optional[str]:
         """从内容中提取标题（第一个H1）"""
@@ -159,23 +232,14 @@ class ContentParser:
     
     def _extract_stock_codes(self, content: str) -> List[str]:
         """提取股票代码"""
-        matches = self.STOCK_CODE_PATTERN.findall(content)
-        # 去重并保持顺序
-        seen = set()
-        unique_codes = []
-        for code in matches:
-            if code not in seen:
-                seen.add(code)
-                unique_codes.append(code)
-        return unique_codes
+        # 去重并保持顺序（dict保留插入顺序）
+        return list(dict.fromkeys(self.STOCK_CODE_PATTERN.findall(content)))
     
     def _extract_industries(self, content: str) -> List[str]:
         """提取提及的行业"""
-        mentioned = []
-        for keyword in self.INDUSTRY_KEYWORDS:
-            if keyword in content:
-                mentioned.append(keyword)
-        return mentioned
+        found = self._industry_matcher.find(content)
+        # 按关键词声明顺序返回
+        return [kw for kw in self.INDUSTRY_KEYWORDS if kw in found]
 
 
 # 模块级便捷实例
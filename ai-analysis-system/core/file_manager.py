@@ -7,11 +7,14 @@ AI信息分析系统 - 文件管理模块
 - 管理文件的归档和移动
 """
 
+import errno
+import mmap
 import os
 import shutil
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .config import INPUT_DIR, PROCESSING_DIR, OUTPUT_DIR, NamingConfig
 
@@ -25,6 +28,9 @@ class FileManager:
         self.processing_dir = PROCESSING_DIR
         self.output_dir = OUTPUT_DIR
         
+        # 目录 -> (目录修改时间, 文件列表)，目录内增删文件后自动失效
+        self._listing_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+        
     def get_pending_files(self, extension: str = ".md") -> List[Path]:
         """
         获取input文件夹中待处理的文件
@@ -35,14 +41,12 @@ class FileManager:
         Returns:
             待处理文件路径列表
         """
-        pending_files = []
-        for file_path in self.input_dir.glob(f"*{extension}"):
-            # 排除README文件
-            if file_path.name.lower() != "readme.md":
-                pending_files.append(file_path)
-        
-        # 按文件名排序（通常包含日期）
-        return sorted(pending_files)
+        # 列表已按文件名排序（通常包含日期），排除README文件
+        return [
+            file_path for file_path in self._list_files(self.input_dir)
+            if file_path.name.endswith(extension)
+            and file_path.name.lower() != "readme.md"
+        ]
     
     def get_files_by_date(
         self, 
@@ -66,11 +70,11 @@ class FileManager:
         }
         target_dir = dir_map.get(directory, self.input_dir)
         
-        matching_files = []
-        for file_path in target_dir.glob(f"{date}*.md"):
-            matching_files.append(file_path)
-            
-        return sorted(matching_files)
+        return [
+            file_path for file_path in self._list_files(target_dir)
+            if file_path.name.startswith(date)
+            and file_path.name.endswith(".md")
+        ]
     
     def get_files_in_date_range(
         self,
@@ -96,28 +100,80 @@ class FileManager:
         }
         target_dir = dir_map.get(directory, self.processing_dir)
         
-        start = datetime.strptime(start_date, NamingConfig.DATE_FORMAT)
-        end = datetime.strptime(end_date, NamingConfig.DATE_FORMAT)
+        # 起止日期只解析一次，转为YYYYMMDD整数后逐个比较
+        start = int(
+            datetime.strptime(start_date, NamingConfig.DATE_FORMAT)
+            .strftime("%Y%m%d")
+        )
+        end = int(
+            datetime.strptime(end_date, NamingConfig.DATE_FORMAT)
+            .strftime("%Y%m%d")
+        )
         
         matching_files = []
-        for file_path in target_dir.glob("*.md"):
-            if file_path.name.lower() == "readme.md":
+        for file_path in self._list_files(target_dir):
+            name = file_path.name
+            if not name.endswith(".md") or name.lower() == "readme.md":
                 continue
                 
-            # 尝试从文件名提取日期
-            file_date_str = file_path.stem[:10]  # YYYY-MM-DD
-            try:
-                file_date = datetime.strptime(
-                    file_date_str, 
-                    NamingConfig.DATE_FORMAT
-                )
-                if start <= file_date <= end:
-                    matching_files.append(file_path)
-            except ValueError:
-                # 文件名不符合日期格式，跳过
-                continue
+            # 从文件名提取日期，不符合日期格式的跳过
+            file_date = self._date_key(file_path.stem)
+            if file_date is not None and start <= file_date <= end:
+                matching_files.append(file_path)
                 
-        return sorted(matching_files)
+        return matching_files
+    
+    def _list_files(self, target_dir: Path) -> List[Path]:
+        """
+        列出目录下（不含子目录）的文件，按文件名排序
+        
+        结果按目录的修改时间缓存，同一进程内多次扫描同一目录时
+        只需一次stat。返回的列表为共享缓存，调用方不应修改。
+        
+        Args:
+            target_dir: 目录路径
+            
+        Returns:
+            文件路径列表，目录不存在时为空
+        """
+        try:
+            mtime = os.stat(target_dir).st_mtime_ns
+        except OSError:
+            return []
+            
+        cached = self._listing_cache.get(target_dir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(target_dir) as entries:
+            files = sorted(
+                target_dir / entry.name
+                for entry in entries if entry.is_file()
+            )
+        self._listing_cache[target_dir] = (mtime, files)
+        return files
+    
+    def invalidate_listing(self, target_dir: Path) -> None:
+        """
+        丢弃目录的列表缓存
+        
+        目录修改时间的精度有限，同一时间粒度内新增或移除的文件
+        不一定能被察觉，因此写入文件后需主动丢弃缓存。
+        
+        Args:
+            target_dir: 目录路径
+        """
+        self._listing_cache.pop(target_dir, None)
+    
+    def _date_key(self, stem: str) -> Optional[int]:
+        """将以YYYY-MM-DD开头的文件名转为YYYYMMDD整数，格式不符返回None"""
+        if len(stem) < 10 or stem[4] != "-" or stem[7] != "-":
+            return None
+            
+        digits = stem[:4] + stem[5:7] + stem[8:10]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+        return int(digits)
     
     def save_to_processing(
         self, 
@@ -136,6 +192,7 @@ class FileManager:
         """
         file_path = self.processing_dir / filename
         file_path.write_text(content, encoding="utf-8")
+        self.invalidate_listing(self.processing_dir)
         return file_path
     
     def save_to_output(
@@ -163,6 +220,7 @@ class FileManager:
             
         file_path = target_dir / filename
         file_path.write_text(content, encoding="utf-8")
+        self.invalidate_listing(target_dir)
         return file_path
     
     def move_to_archive(
@@ -184,20 +242,42 @@ class FileManager:
         archive_dir.mkdir(parents=True, exist_ok=True)
         
         dest_path = archive_dir / file_path.name
-        shutil.move(str(file_path), str(dest_path))
+        try:
+            # 归档目录与源文件同在一个文件系统，一次rename即可完成
+            os.replace(file_path, dest_path)
+        except OSError as e:
+            # 仅跨设备时回退到复制+删除，其余错误（权限、源文件不存在等）照常抛出
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(file_path), str(dest_path))
+            
+        self.invalidate_listing(file_path.parent)
+        self.invalidate_listing(archive_dir)
         return dest_path
     
     def read_file(self, file_path: Path) -> str:
         """
         读取文件内容
         
+        通过mmap映射文件后直接解码，省去read_text先把整个文件读入
+        bytes缓冲区的那一份拷贝。换行符按文本模式的规则统一为\\n。
+        
         Args:
             file_path: 文件路径
             
         Returns:
             文件内容字符串
         """
-        return file_path.read_text(encoding="utf-8")
+        with open(file_path, "rb") as f:
+            # 空文件无法映射
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+                
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
     
     def list_all_files(self, directory: str = "all") -> dict:
         """
@@ -229,19 +309,34 @@ class FileManager:
         
         for dir_name, dir_path in dirs_to_scan:
             files = []
-            for file_path in dir_path.rglob("*.md"):
-                if file_path.name.lower() != "readme.md":
+            for entry in self._scan_markdown(str(dir_path)):
+                if entry.name.lower() != "readme.md":
+                    # DirEntry.stat() 结果会被缓存，只需一次系统调用
+                    stat = entry.stat()
                     files.append({
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "size": file_path.stat().st_size,
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": stat.st_size,
                         "modified": datetime.fromtimestamp(
-                            file_path.stat().st_mtime
+                            stat.st_mtime
                         ).isoformat(),
                     })
-            result[dir_name] = sorted(files, key=lambda x: x["name"])
+            result[dir_name] = sorted(files, key=itemgetter("name"))
             
         return result
+    
+    def _scan_markdown(self, directory: str) -> Iterator[os.DirEntry]:
+        """递归遍历目录，返回所有.md文件的目录项"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._scan_markdown(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield entry
+        except OSError:
+            # 目录不存在或无权限时跳过，与Path.rglob行为一致
+            return
 
 
 # 模块级别的便捷实例
@@ -0,0 +1,90 @@
+"""
+AI信息分析系统 - 关键词匹配模块
+
+本模块提供多关键词匹配功能，对文本只扫描一遍即可找出所有关键词命中。
+安装了 pyahocorasick 时使用 Aho-Corasick 自动机，否则退化为预编译的
+正则多选分支，由C实现的正则引擎完成扫描。
+"""
+
+import re
+from typing import Iterable, Iterator, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # 可选依赖
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """多关键词匹配器"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        初始化匹配器，预先构建自动机
+
+        Args:
+            keywords: 关键词列表（重复项和空串会被忽略）
+        """
+        self.keywords = tuple(dict.fromkeys(kw for kw in keywords if kw))
+
+        # 关键词首字符集合，供find()预筛选
+        self._first_chars = frozenset(kw[0] for kw in self.keywords)
+
+        self._automaton = None
+        self._pattern = None
+        if not self.keywords:
+            return
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+        else:
+            # 零宽前瞻让每个起点都能命中，长词优先保证取到最长关键词
+            ordered = sorted(self.keywords, key=len, reverse=True)
+            self._pattern = re.compile(
+                "(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))"
+            )
+            # 同一起点上，最长命中的前缀关键词同样出现
+            self._prefixes = {
+                kw: [p for p in self.keywords if kw.startswith(p)]
+                for kw in self.keywords
+            }
+
+    def iter(self, content: str) -> Iterator[Tuple[int, str]]:
+        """
+        遍历文本中的所有关键词命中
+
+        Args:
+            content: 待匹配文本
+
+        Yields:
+            (结束位置, 关键词)，结束位置为关键词最后一个字符的下标
+        """
+        if self._automaton is not None:
+            return self._automaton.iter(content)
+        return self._iter_fallback(content)
+
+    def find(self, content: str) -> Set[str]:
+        """返回文本中出现过的关键词集合"""
+        if self._automaton is not None:
+            return {kw for _, kw in self._automaton.iter(content)}
+
+        # 只需判断是否出现时，先用首字符排除文本中不可能出现的关键词，
+        # 剩余的再做子串查找，通常比完整的正则扫描更省
+        present = self._first_chars.intersection(content)
+        return {
+            kw for kw in self.keywords
+            if kw[0] in present and kw in content
+        }
+
+    def _iter_fallback(self, content: str) -> Iterator[Tuple[int, str]]:
+        """未安装pyahocorasick时基于正则的实现"""
+        if self._pattern is None:
+            return
+
+        for match in self._pattern.finditer(content):
+            start = match.start()
+            for kw in self._prefixes[match.group(1)]:
+                yield start + len(kw) - 1, kw
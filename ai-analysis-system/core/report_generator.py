@@ -4,18 +4,64 @@ AI信息分析系统 - 报告生成模块
 本模块负责生成各类分析报告。
 """
 
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Union
 
 from .analyzer import AnalysisResult
-from .config import ReportTemplates, NamingConfig, PROCESSING_DIR
+from .config import (
+    ReportTemplates,
+    NamingConfig,
+    StockScreenerConfig,
+    PROCESSING_DIR,
+)
+from .file_manager import file_manager
 from .stock_screener import StockRecommendation
 
 
+class _SentimentStats(NamedTuple):
+    """分析结果的情感统计"""
+    
+    total: int
+    positive: int
+    negative: int
+    score_sum: float
+
+
 class ReportGenerator:
     """报告生成器"""
     
+    # 情感与推荐等级对应的图标
+    _SENTIMENT_EMOJI = {
+        "positive": "📈",
+        "negative": "📉",
+        "neutral": "➖",
+    }
+    _LEVEL_EMOJI = {
+        "strong": "⭐⭐⭐",
+        "moderate": "⭐⭐",
+        "watch": "⭐",
+    }
+    
+    # 保存报告时的写缓冲区大小
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    # 表格表头
+    _STOCK_HIGHLIGHT_HEADER = (
+        "| 代码 | 名称 | 提及次数 | 积极消息 |",
+        "|------|------|----------|----------|",
+    )
+    _INDUSTRY_HEADER = (
+        "| 行业 | 热度 | 平均情感 |",
+        "|------|------|----------|",
+    )
+    _RECOMMENDATION_HEADER = (
+        "| 代码 | 名称 | 推荐等级 | 分数 | 相关行业 |",
+        "|------|------|----------|------|----------|",
+    )
+    
     def __init__(self):
         """初始化报告生成器"""
         self.templates = ReportTemplates()
@@ -41,7 +87,7 @@ class ReportGenerator:
         
         # 计算整体情感
         overall_sentiment = self._calculate_overall_sentiment(
-            analysis_results
+            self._summary_stats(analysis_results)
         )
         
         # 提取热门行业
@@ -106,7 +152,9 @@ class ReportGenerator:
         )
         
         # 周总结
-        weekly_summary = self._generate_weekly_summary(analysis_results)
+        weekly_summary = self._generate_weekly_summary(
+            self._summary_stats(analysis_results)
+        )
         
         # 下周展望
         next_week_outlook = self._generate_outlook()
@@ -150,8 +198,6 @@ class ReportGenerator:
         # 详细分析
         detailed_analysis = self._format_detailed_analysis(recommendations)
         
-        from .config import StockScreenerConfig
-        
         report = self.templates.STOCK_SCREENING.format(
             date=date,
             min_mentions=min_mentions,
@@ -165,7 +211,7 @@ class ReportGenerator:
     
     def save_report(
         self, 
-        content: str, 
+        content: Union[str, Iterable[str]], 
         filename: str,
         output_dir: Optional[Path] = None
     ) -> Path:
@@ -173,7 +219,7 @@ class ReportGenerator:
         保存报告到文件
         
         Args:
-            content: 报告内容
+            content: 报告内容，也可以是逐段生成的字符串序列
             filename: 文件名
             output_dir: 输出目录，默认为processing
             
@@ -182,7 +228,13 @@ class ReportGenerator:
         """
         target_dir = output_dir or self.output_dir
         file_path = target_dir / filename
-        file_path.write_text(content, encoding="utf-8")
+        
+        chunks = (content,) if isinstance(content, str) else content
+        # 逐段编码写入缓冲区，无需先拼出完整报告
+        with open(file_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8"))
+        file_manager.invalidate_listing(target_dir)
         return file_path
     
     # ========== 私有辅助方法 ==========
@@ -195,27 +247,38 @@ class ReportGenerator:
         if not results:
             return "今日暂无重要财经新闻。"
             
-        lines = []
-        for i, result in enumerate(results[:5], 1):
-            sentiment_emoji = {
-                "positive": "📈",
-                "negative": "📉",
-                "neutral": "➖",
-            }.get(result.sentiment, "➖")
-            
-            lines.append(f"{i}. {sentiment_emoji} {result.summary}")
-            
-        return "\n".join(lines)
+        emoji = self._SENTIMENT_EMOJI
+        return "\n".join(
+            f"{i}. {emoji.get(result.sentiment, '➖')} {result.summary}"
+            for i, result in enumerate(results[:5], 1)
+        )
     
-    def _calculate_overall_sentiment(
+    def _summary_stats(
         self, 
         results: List[AnalysisResult]
+    ) -> _SentimentStats:
+        """一次遍历统计条数、积极/消极条数和情感分数之和"""
+        total = positive = negative = 0
+        score_sum = 0.0
+        for r in results:
+            total += 1
+            score_sum += r.sentiment_score
+            if r.sentiment == "positive":
+                positive += 1
+            elif r.sentiment == "negative":
+                negative += 1
+                
+        return _SentimentStats(total, positive, negative, score_sum)
+    
+    def _calculate_overall_sentiment(
+        self, 
+        stats: _SentimentStats
     ) -> str:
         """计算整体市场情感"""
-        if not results:
+        if not stats.total:
             return "中性"
             
-        avg_score = sum(r.sentiment_score for r in results) / len(results)
+        avg_score = stats.score_sum / stats.total
         
         if avg_score > 0.6:
             return "偏乐观 📈"
@@ -229,57 +292,41 @@ class ReportGenerator:
         results: List[AnalysisResult]
     ) -> List[str]:
         """获取热门行业"""
-        industry_count = {}
-        for result in results:
-            for ind in result.related_industries:
-                industry_count[ind] = industry_count.get(ind, 0) + 1
-                
+        industry_count = Counter(chain.from_iterable(
+            r.related_industries for r in results
+        ))
+        
         # 按出现次数排序，取前5
-        sorted_industries = sorted(
-            industry_count.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return [ind for ind, _ in sorted_industries[:5]]
+        return [ind for ind, _ in industry_count.most_common(5)]
     
     def _format_stock_highlights(
         self, 
         results: List[AnalysisResult]
     ) -> str:
         """格式化重点股票"""
-        all_stocks = {}
+        mentions = Counter()
+        positives = Counter()
+        names = {}
         for result in results:
+            is_positive = result.sentiment == "positive"
             for stock in result.related_stocks:
                 code = stock["code"]
-                if code not in all_stocks:
-                    all_stocks[code] = {
-                        "info": stock,
-                        "count": 0,
-                        "positive": 0,
-                    }
-                all_stocks[code]["count"] += 1
-                if result.sentiment == "positive":
-                    all_stocks[code]["positive"] += 1
-        
-        if not all_stocks:
+                mentions[code] += 1
+                if is_positive:
+                    positives[code] += 1
+                # 名称取首次出现时的信息
+                if code not in names:
+                    names[code] = stock.get("name", "-")
+        
+        if not mentions:
             return "今日暂无明显的股票热点。"
         
-        # 按提及次数排序
-        sorted_stocks = sorted(
-            all_stocks.items(),
-            key=lambda x: x[1]["count"],
-            reverse=True
-        )[:5]
-        
-        lines = ["| 代码 | 名称 | 提及次数 | 积极消息 |",
-                 "|------|------|----------|----------|"]
-        for code, data in sorted_stocks:
-            lines.append(
-                f"| {code} | {data['info'].get('name', '-')} | "
-                f"{data['count']} | {data['positive']} |"
-            )
-            
-        return "\n".join(lines)
+        # 按提及次数排序，取前5
+        rows = (
+            f"| {code} | {names[code]} | {count} | {positives[code]} |"
+            for code, count in mentions.most_common(5)
+        )
+        return "\n".join(chain(self._STOCK_HIGHLIGHT_HEADER, rows))
     
     def _generate_investment_advice(
         self,
@@ -306,51 +353,48 @@ class ReportGenerator:
         results: List[AnalysisResult]
     ) -> str:
         """格式化本周热点"""
-        high_importance = [r for r in results if r.importance == "high"]
+        # 只取前5条重要摘要，取够即停止遍历
+        highlights = list(islice(
+            (r.summary for r in results if r.importance == "high"),
+            5
+        ))
         
-        if not high_importance:
+        if not highlights:
             return "本周暂无特别重大事件。"
             
-        lines = []
-        for result in high_importance[:5]:
-            lines.append(f"- {result.summary}")
-            
-        return "\n".join(lines)
+        return "\n".join(f"- {summary}" for summary in highlights)
     
     def _format_industry_performance(
         self, 
         results: List[AnalysisResult]
     ) -> str:
         """格式化行业表现"""
-        industry_sentiment = {}
+        industry_count = Counter()
+        score_sum = defaultdict(float)
         for result in results:
+            score = result.sentiment_score
             for ind in result.related_industries:
-                if ind not in industry_sentiment:
-                    industry_sentiment[ind] = {"scores": [], "count": 0}
-                industry_sentiment[ind]["scores"].append(
-                    result.sentiment_score
-                )
-                industry_sentiment[ind]["count"] += 1
-        
-        if not industry_sentiment:
+                industry_count[ind] += 1
+                score_sum[ind] += score
+        
+        if not industry_count:
             return "本周行业表现数据不足。"
         
-        lines = ["| 行业 | 热度 | 平均情感 |",
-                 "|------|------|----------|"]
-        for ind, data in sorted(
-            industry_sentiment.items(),
-            key=lambda x: x[1]["count"],
-            reverse=True
-        )[:8]:
-            avg_score = sum(data["scores"]) / len(data["scores"])
-            sentiment_str = "🔥" if avg_score > 0.6 else (
-                "❄️" if avg_score < 0.4 else "➖"
-            )
-            lines.append(
-                f"| {ind} | {data['count']}篇 | {sentiment_str} |"
-            )
-            
-        return "\n".join(lines)
+        rows = (
+            f"| {ind} | {count}篇 | "
+            f"{self._industry_sentiment_icon(score_sum[ind] / count)} |"
+            for ind, count in industry_count.most_common(8)
+        )
+        return "\n".join(chain(self._INDUSTRY_HEADER, rows))
+    
+    @staticmethod
+    def _industry_sentiment_icon(avg_score: float) -> str:
+        """行业平均情感对应的图标"""
+        if avg_score > 0.6:
+            return "🔥"
+        if avg_score < 0.4:
+            return "❄️"
+        return "➖"
     
     def _format_recommendations(
         self, 
@@ -360,37 +404,25 @@ class ReportGenerator:
         if not recommendations:
             return "本周暂无符合条件的推荐股票。"
             
-        lines = ["| 代码 | 名称 | 推荐等级 | 分数 | 相关行业 |",
-                 "|------|------|----------|------|----------|"]
-        
-        level_emoji = {
-            "strong": "⭐⭐⭐",
-            "moderate": "⭐⭐",
-            "watch": "⭐",
-        }
-        
-        for rec in recommendations[:10]:
-            industries = "、".join(rec.related_industries[:2])
-            lines.append(
-                f"| {rec.code} | {rec.name} | "
-                f"{level_emoji.get(rec.recommendation_level, '⭐')} | "
-                f"{rec.recommendation_score} | {industries} |"
-            )
-            
-        return "\n".join(lines)
+        level_emoji = self._LEVEL_EMOJI
+        rows = (
+            f"| {rec.code} | {rec.name} | "
+            f"{level_emoji.get(rec.recommendation_level, '⭐')} | "
+            f"{rec.recommendation_score} | "
+            f"{'、'.join(rec.related_industries[:2])} |"
+            for rec in recommendations[:10]
+        )
+        return "\n".join(chain(self._RECOMMENDATION_HEADER, rows))
     
     def _generate_weekly_summary(
         self, 
-        results: List[AnalysisResult]
+        stats: _SentimentStats
     ) -> str:
         """生成周总结"""
-        total = len(results)
-        positive = sum(1 for r in results if r.sentiment == "positive")
-        negative = sum(1 for r in results if r.sentiment == "negative")
-        
         return (
-            f"本周共分析 {total} 条财经信息，其中积极消息 {positive} 条，"
-            f"消极消息 {negative} 条。"
+            f"本周共分析 {stats.total} 条财经信息，"
+            f"其中积极消息 {stats.positive} 条，"
+            f"消极消息 {stats.negative} 条。"
         )
     
     def _generate_outlook(self) -> str:
@@ -408,14 +440,12 @@ class ReportGenerator:
         if not recommendations:
             return "未筛选出符合条件的股票。"
             
-        strong = [r for r in recommendations if r.recommendation_level == "strong"]
-        moderate = [r for r in recommendations if r.recommendation_level == "moderate"]
-        watch = [r for r in recommendations if r.recommendation_level == "watch"]
+        level_count = Counter(r.recommendation_level for r in recommendations)
         
         return f"""
-- 强烈推荐：{len(strong)} 只
-- 适度关注：{len(moderate)} 只
-- 持续观察：{len(watch)} 只
+- 强烈推荐：{level_count["strong"]} 只
+- 适度关注：{level_count["moderate"]} 只
+- 持续观察：{level_count["watch"]} 只
 """
     
     def _format_detailed_analysis(
@@ -426,9 +456,17 @@ class ReportGenerator:
         if not recommendations:
             return "无详细分析。"
             
-        lines = []
-        for rec in recommendations[:5]:
-            lines.append(f"""
+        return "\n".join(chain.from_iterable(
+            self._detailed_analysis_lines(rec)
+            for rec in recommendations[:5]
+        ))
+    
+    def _detailed_analysis_lines(
+        self, 
+        rec: StockRecommendation
+    ) -> Iterator[str]:
+        """逐行生成单只股票的详细分析"""
+        yield f"""
 ### {rec.code} - {rec.name}
 
 - **推荐等级**：{rec.recommendation_level}
@@ -438,11 +476,9 @@ class ReportGenerator:
 - **相关行业**：{', '.join(rec.related_industries)}
 
 **相关新闻**：
-""")
-            for news in rec.key_news:
-                lines.append(f"- {news}")
-                
-        return "\n".join(lines)
+"""
+        for news in rec.key_news:
+            yield f"- {news}"
 
 
 # 模块级便捷实例
@@ -4,15 +4,17 @@ AI信息分析系统 - 股票筛选模块
 本模块负责基于新闻分析结果筛选有投资价值的股票。
 """
 
-from collections import defaultdict
+import heapq
+import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .analyzer import AnalysisResult
 from .config import StockScreenerConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class StockRecommendation:
     """股票推荐结果"""
     
@@ -30,6 +32,9 @@ class StockRecommendation:
 class StockScreener:
     """股票筛选器"""
     
+    # 每只股票最多保留的相关新闻条数
+    MAX_KEY_NEWS = 3
+    
     def __init__(self, config: Optional[StockScreenerConfig] = None):
         """
         初始化筛选器
@@ -41,13 +46,15 @@ class StockScreener:
         
     def screen(
         self, 
-        analysis_results: List[AnalysisResult]
+        analysis_results: List[AnalysisResult],
+        top_k: Optional[int] = None
     ) -> List[StockRecommendation]:
         """
         根据分析结果筛选股票
         
         Args:
             analysis_results: 新闻分析结果列表
+            top_k: 只返回分数最高的前K只股票，默认返回全部
             
         Returns:
             股票推荐列表，按推荐分数排序
@@ -55,72 +62,101 @@ class StockScreener:
         # 统计股票被提及的情况
         stock_stats = self._aggregate_stock_stats(analysis_results)
         
-        # 生成推荐
-        recommendations = []
+        # 行业种类远少于股票数，每个行业只判断一次是否属于关注行业
+        focus_table = self._build_focus_table(stock_stats)
+        
+        # 先只计算分数，通过筛选且排名靠前的股票才构建推荐对象
+        scored = []
         for code, stats in stock_stats.items():
-            rec = self._evaluate_stock(code, stats)
-            if rec:
-                recommendations.append(rec)
+            evaluated = self._score_stock(stats, focus_table)
+            if evaluated is not None:
+                scored.append((code, *evaluated))
         
         # 按推荐分数排序
-        recommendations.sort(
-            key=lambda x: x.recommendation_score, 
-            reverse=True
-        )
+        if top_k is None:
+            scored.sort(key=itemgetter(1), reverse=True)
+        else:
+            scored = heapq.nlargest(top_k, scored, key=itemgetter(1))
         
-        return recommendations
+        return [
+            self._build_recommendation(code, stock_stats[code], score, avg)
+            for code, score, avg in scored
+        ]
     
     def _aggregate_stock_stats(
         self, 
         results: List[AnalysisResult]
     ) -> Dict[str, dict]:
         """聚合股票统计信息"""
-        stats = defaultdict(lambda: {
-            "name": "",
-            "market": "",
-            "mention_count": 0,
-            "sentiment_scores": [],
-            "industries": set(),
-            "news_summaries": [],
-        })
+        stats: Dict[str, dict] = {}
         
         for result in results:
+            # 同一条结果的字段对其下所有股票相同，只读取一次
+            score = result.sentiment_score
+            # 转为frozenset后并入各股票的行业集合时直接复用已存的哈希
+            industries = frozenset(result.related_industries)
+            summary = result.summary
+            
             for stock in result.related_stocks:
                 code = stock["code"]
-                stats[code]["name"] = stock.get("name", f"股票{code}")
-                stats[code]["market"] = stock.get("market", "")
-                stats[code]["mention_count"] += 1
-                stats[code]["sentiment_scores"].append(
-                    result.sentiment_score
-                )
-                stats[code]["industries"].update(result.related_industries)
-                stats[code]["news_summaries"].append(result.summary)
+                entry = stats.get(code)
+                if entry is None:
+                    entry = stats[code] = {
+                        "name": "",
+                        "market": "",
+                        "mention_count": 0,
+                        "sentiment_sum": 0.0,
+                        "industries": set(),
+                        "news_summaries": [],
+                    }
+                entry["name"] = stock.get("name", f"股票{code}")
+                entry["market"] = stock.get("market", "")
+                entry["mention_count"] += 1
+                entry["sentiment_sum"] += score
+                entry["industries"] |= industries
+                summaries = entry["news_summaries"]
+                if len(summaries) < self.MAX_KEY_NEWS:
+                    summaries.append(summary)
                 
-        return dict(stats)
+        return stats
     
-    def _evaluate_stock(
-        self, 
-        code: str, 
-        stats: dict
-    ) -> Optional[StockRecommendation]:
+    def _build_focus_table(self, stock_stats: Dict[str, dict]) -> Dict[str, bool]:
+        """对所有出现过的行业预先判断是否命中关注行业"""
+        all_industries = set().union(
+            *(entry["industries"] for entry in stock_stats.values())
+        )
+        # 每次screen时按当前配置编译关注行业的多选正则，
+        # 配置被原地修改后同样生效；判断每个行业只需扫描一遍
+        focus = self.config.FOCUS_INDUSTRIES
+        if not focus:
+            return dict.fromkeys(all_industries, False)
+        focus_re = re.compile("|".join(re.escape(f) for f in focus))
+        return {
+            ind: focus_re.search(ind) is not None
+            for ind in all_industries
+        }
+    
+    def _score_stock(
+        self,
+        stats: dict,
+        focus_table: Dict[str, bool]
+    ) -> Optional[Tuple[float, float]]:
         """
-        评估单只股票
+        评估单只股票，只计算分数不构建推荐对象
         
         Args:
-            code: 股票代码
             stats: 统计信息
+            focus_table: 行业 -> 是否属于关注行业，需包含该股票的全部行业
             
         Returns:
-            股票推荐结果，不符合条件返回None
+            (推荐分数, 平均情感分数)，不符合条件返回None
         """
         # 最小提及次数过滤
         if stats["mention_count"] < self.config.MIN_MENTION_COUNT:
             return None
         
         # 计算平均情感分数
-        avg_sentiment = sum(stats["sentiment_scores"]) / len(
-            stats["sentiment_scores"]
-        )
+        avg_sentiment = stats["sentiment_sum"] / stats["mention_count"]
         
         # 情感分数阈值过滤
         if avg_sentiment < self.config.SENTIMENT_THRESHOLD:
@@ -130,12 +166,20 @@ class StockScreener:
         score = self._calculate_score(
             stats["mention_count"],
             avg_sentiment,
-            list(stats["industries"])
+            stats["industries"],
+            focus_table
         )
         
-        # 确定推荐等级
-        level = self._get_recommendation_level(score)
-        
+        return score, avg_sentiment
+    
+    def _build_recommendation(
+        self, 
+        code: str, 
+        stats: dict,
+        score: float,
+        avg_sentiment: float
+    ) -> StockRecommendation:
+        """根据统计信息和分数构建推荐结果"""
         return StockRecommendation(
             code=code,
             name=stats["name"],
@@ -143,21 +187,28 @@ class StockScreener:
             mention_count=stats["mention_count"],
             avg_sentiment=avg_sentiment,
             related_industries=list(stats["industries"]),
-            key_news=stats["news_summaries"][:3],  # 最多3条相关新闻
+            key_news=stats["news_summaries"],
             recommendation_score=score,
-            recommendation_level=level,
+            recommendation_level=self._get_recommendation_level(score),
         )
     
     def _calculate_score(
         self,
         mention_count: int,
         avg_sentiment: float,
-        industries: List[str]
+        industries: Iterable[str],
+        focus_table: Dict[str, bool]
     ) -> float:
         """
         计算推荐分数
         
         分数范围：0-100
+        
+        Args:
+            mention_count: 提及次数
+            avg_sentiment: 平均情感分数
+            industries: 相关行业
+            focus_table: 行业 -> 是否属于关注行业
         """
         score = 0.0
         
@@ -170,10 +221,7 @@ class StockScreener:
         score += sentiment_score
         
         # 行业加成（最高30分）
-        focus_match = sum(
-            1 for ind in industries 
-            if any(f in ind for f in self.config.FOCUS_INDUSTRIES)
-        )
+        focus_match = sum(1 for ind in industries if focus_table[ind])
         industry_score = min(focus_match * 10, 30)
         score += industry_score
         
@@ -9,15 +9,15 @@ from pathlib import Path
 from typing import List, Optional
 
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:  # 避免重复导入时反复插入
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core import (
     file_manager,
-    content_parser,
-    news_analyzer,
     report_generator,
     NamingConfig,
-    AnalysisResult,
+    analyze_all,
 )
 
 
@@ -60,21 +60,8 @@ def analyze_news(
             "message": "没有找到待分析的文件",
         }
     
-    # 分析每个文件
-    analysis_results: List[AnalysisResult] = []
-    
-    for file_path in files:
-        try:
-            # 解析内容
-            parsed = content_parser.parse_file(file_path)
-            
-            # 分析内容
-            result = news_analyzer.analyze(parsed)
-            analysis_results.append(result)
-            
-        except Exception as e:
-            print(f"处理文件 {file_path} 时出错: {e}")
-            continue
+    # 分析每个文件（文件较多时多进程并行）
+    analysis_results = analyze_all(files)
     
     # 生成每日分析报告
     report_content = report_generator.generate_daily_analysis(
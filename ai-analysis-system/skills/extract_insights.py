@@ -4,22 +4,34 @@ AI信息分析系统 - 洞察提取技能
 从processing文件夹提取精华内容生成笔记保存到output。
 """
 
+import io
+from collections import Counter
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import List, Optional
 
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:  # 避免重复导入时反复插入
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core import (
     file_manager,
-    content_parser,
-    news_analyzer,
     NamingConfig,
     OUTPUT_DIR,
+    analyze_files,
 )
 
 
+# 情感对应的图标
+_SENTIMENT_EMOJI = {
+    "positive": "📈",
+    "negative": "📉",
+    "neutral": "➖",
+}
+
+
 def extract_insights(
     source_files: Optional[List[Path]] = None,
     importance_filter: str = "high",
@@ -53,31 +65,31 @@ def extract_insights(
     # 收集洞察
     insights = []
     
-    for file_path in source_files:
-        try:
-            content = file_manager.read_file(file_path)
-            
-            # 解析并分析
-            parsed = content_parser.parse_content(content, file_path.name)
-            analysis = news_analyzer.analyze(parsed)
-            
-            # 根据重要性过滤
-            if importance_filter != "all":
-                if analysis.importance != importance_filter:
-                    continue
-            
-            insights.append({
-                "source": file_path.name,
-                "summary": analysis.summary,
-                "key_points": analysis.key_points,
-                "sentiment": analysis.sentiment,
-                "importance": analysis.importance,
-                "industries": analysis.related_industries,
-                "stocks": [s["code"] for s in analysis.related_stocks],
-            })
+    # 读取、解析并分析（文件较多时多进程并行），出错的文件结果为None；
+    # 按重要性过滤时，解析后即可排除的文件不再做完整分析
+    analyses = analyze_files(
+        source_files,
+        importance=None if importance_filter == "all" else importance_filter
+    )
+    
+    for file_path, analysis in zip(source_files, analyses):
+        if analysis is None:
+            continue
             
-        except Exception as e:
-            print(f"处理 {file_path} 时出错: {e}")
+        # 根据重要性过滤
+        if importance_filter != "all":
+            if analysis.importance != importance_filter:
+                continue
+        
+        insights.append({
+            "source": file_path.name,
+            "summary": analysis.summary,
+            "key_points": analysis.key_points,
+            "sentiment": analysis.sentiment,
+            "importance": analysis.importance,
+            "industries": analysis.related_industries,
+            "stocks": [s["code"] for s in analysis.related_stocks],
+        })
     
     if not insights:
         return {
@@ -85,11 +97,17 @@ def extract_insights(
             "message": f"没有符合条件（重要性={importance_filter}）的洞察",
         }
     
+    # 笔记标题与文件名使用同一时刻的日期
+    now = datetime.now()
+    
     # 生成笔记
-    note_content = _format_insights_note(insights)
+    note_content = _format_insights_note(
+        insights,
+        now.strftime("%Y年%m月%d日")
+    )
     
     # 保存到output
-    date = datetime.now().strftime(NamingConfig.DATE_FORMAT)
+    date = now.strftime(NamingConfig.DATE_FORMAT)
     filename = NamingConfig.INSIGHT_NOTE_NAME.format(date=date)
     
     note_path = file_manager.save_to_output(
@@ -106,66 +124,75 @@ def extract_insights(
     }
 
 
-def _format_insights_note(insights: List[dict]) -> str:
-    """格式化洞察笔记"""
-    date = datetime.now().strftime("%Y年%m月%d日")
+def _format_insights_note(
+    insights: List[dict],
+    date: Optional[str] = None
+) -> str:
+    """
+    格式化洞察笔记
+    
+    Args:
+        insights: 洞察列表
+        date: 笔记标题中的日期，默认为今天
+        
+    Returns:
+        笔记内容
+    """
+    if date is None:
+        date = datetime.now().strftime("%Y年%m月%d日")
+    
+    buf = io.StringIO()
+    w = buf.write
     
-    lines = [
-        f"# {date} 投资洞察笔记\n",
-        "## 📊 洞察概览\n",
-        f"- 共提取 {len(insights)} 条重要洞察",
-    ]
+    w(f"# {date} 投资洞察笔记\n\n"
+      "## 📊 洞察概览\n\n"
+      f"- 共提取 {len(insights)} 条重要洞察\n")
     
     # 统计行业分布
-    industry_count = {}
-    for insight in insights:
-        for ind in insight["industries"]:
-            industry_count[ind] = industry_count.get(ind, 0) + 1
+    industry_count = Counter(chain.from_iterable(
+        insight["industries"] for insight in insights
+    ))
     
     if industry_count:
-        top_industries = sorted(
-            industry_count.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:5]
-        lines.append(f"- 热门行业：{', '.join([i[0] for i in top_industries])}")
+        top_industries = industry_count.most_common(5)
+        w(f"- 热门行业：{', '.join(name for name, _ in top_industries)}\n")
     
-    lines.append("\n---\n")
-    lines.append("## 🔍 详细洞察\n")
+    w("\n---\n\n"
+      "## 🔍 详细洞察\n\n")
     
+    emoji = _SENTIMENT_EMOJI
     for i, insight in enumerate(insights, 1):
-        sentiment_emoji = {
-            "positive": "📈",
-            "negative": "📉", 
-            "neutral": "➖",
-        }.get(insight["sentiment"], "➖")
+        sentiment_emoji = emoji.get(insight["sentiment"], "➖")
+        key_points = insight["key_points"]
+        stocks = insight["stocks"]
+        industries = insight["industries"]
         
-        lines.append(f"### {i}. {sentiment_emoji} {insight['summary'][:50]}...\n")
-        lines.append(f"**来源**：{insight['source']}")
-        lines.append(f"**重要性**：{insight['importance']}")
+        w(f"### {i}. {sentiment_emoji} {insight['summary'][:50]}...\n\n"
+          f"**来源**：{insight['source']}\n"
+          f"**重要性**：{insight['importance']}\n")
         
-        if insight["key_points"]:
-            lines.append("\n**关键要点**：")
-            for point in insight["key_points"][:3]:
-                lines.append(f"- {point}")
+        if key_points:
+            w("\n**关键要点**：\n")
+            for point in key_points[:3]:
+                w(f"- {point}\n")
         
-        if insight["stocks"]:
-            lines.append(f"\n**相关股票**：{', '.join(insight['stocks'])}")
+        if stocks:
+            w(f"\n**相关股票**：{', '.join(stocks)}\n")
         
-        if insight["industries"]:
-            lines.append(f"**相关行业**：{', '.join(insight['industries'])}")
+        if industries:
+            w(f"**相关行业**：{', '.join(industries)}\n")
         
-        lines.append("\n---\n")
+        w("\n---\n\n")
     
-    lines.append("\n## 💡 行动建议\n")
-    lines.append("基于以上洞察，建议：")
-    lines.append("1. 持续关注热门行业的政策动态")
-    lines.append("2. 对多次被提及的股票做进一步研究")
-    lines.append("3. 结合自身风险偏好做出投资决策")
-    lines.append("\n---\n")
-    lines.append("*本笔记由AI辅助生成，投资需谨慎*\n")
+    w("\n## 💡 行动建议\n\n"
+      "基于以上洞察，建议：\n"
+      "1. 持续关注热门行业的政策动态\n"
+      "2. 对多次被提及的股票做进一步研究\n"
+      "3. 结合自身风险偏好做出投资决策\n"
+      "\n---\n\n"
+      "*本笔记由AI辅助生成，投资需谨慎*\n")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def archive_processed(
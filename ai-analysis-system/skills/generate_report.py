@@ -6,19 +6,19 @@ AI信息分析系统 - 周报生成技能
 
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Tuple
 
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:  # 避免重复导入时反复插入
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core import (
     file_manager,
-    content_parser,
-    news_analyzer,
     stock_screener,
     report_generator,
     NamingConfig,
-    AnalysisResult,
+    analyze_all,
 )
 
 
@@ -47,30 +47,43 @@ def generate_weekly_report(
         monday = today - timedelta(days=today.weekday())
         start_date = monday.strftime(NamingConfig.DATE_FORMAT)
     
-    # 获取日期范围内的分析报告
-    processing_files = file_manager.get_files_in_date_range(
-        start_date, 
-        end_date,
-        "processing"
-    )
+    result, report_content = _build_report(start_date, end_date)
+    
+    # 保存周报
+    date_obj = datetime.strptime(start_date, NamingConfig.DATE_FORMAT)
+    year = date_obj.year
+    week = date_obj.isocalendar()[1]
+    
+    filename = NamingConfig.WEEKLY_REPORT_NAME.format(year=year, week=week)
+    report_path = report_generator.save_report(report_content, filename)
+    
+    result["report_path"] = str(report_path)
+    result["message"] = f"周报已生成：{report_path}"
+    
+    return result
+
+
+def _build_report(start_date: str, end_date: str) -> Tuple[dict, str]:
+    """
+    分析日期范围内的文件并生成报告内容（不保存）
     
-    # 同时获取原始input文件进行再分析
+    Args:
+        start_date: 开始日期（YYYY-MM-DD）
+        end_date: 结束日期（YYYY-MM-DD）
+        
+    Returns:
+        (统计信息字典, 报告内容)
+    """
+    # processing中只有Markdown报告，没有可复用的结构化分析结果，
+    # 直接对日期范围内的原始input文件进行分析
     input_files = file_manager.get_files_in_date_range(
         start_date,
         end_date,
         "input"
     )
     
-    # 合并分析
-    analysis_results: List[AnalysisResult] = []
-    
-    for file_path in input_files:
-        try:
-            parsed = content_parser.parse_file(file_path)
-            result = news_analyzer.analyze(parsed)
-            analysis_results.append(result)
-        except Exception as e:
-            print(f"处理 {file_path} 时出错: {e}")
+    # 合并分析（文件较多时多进程并行）
+    analysis_results = analyze_all(input_files)
     
     # 股票筛选
     recommendations = stock_screener.screen(analysis_results)
@@ -83,23 +96,14 @@ def generate_weekly_report(
         recommendations
     )
     
-    # 保存周报
-    date_obj = datetime.strptime(start_date, NamingConfig.DATE_FORMAT)
-    year = date_obj.year
-    week = date_obj.isocalendar()[1]
-    
-    filename = NamingConfig.WEEKLY_REPORT_NAME.format(year=year, week=week)
-    report_path = report_generator.save_report(report_content, filename)
-    
-    return {
+    result = {
         "start_date": start_date,
         "end_date": end_date,
         "files_analyzed": len(input_files),
         "news_count": len(analysis_results),
         "stocks_recommended": len(recommendations),
-        "report_path": str(report_path),
-        "message": f"周报已生成：{report_path}",
     }
+    return result, report_content
 
 
 def generate_monthly_report(
@@ -135,13 +139,12 @@ def generate_monthly_report(
     last_day = next_month - timedelta(days=1)
     end_date = last_day.strftime(NamingConfig.DATE_FORMAT)
     
-    # 使用周报逻辑（复用代码）
-    result = generate_weekly_report(start_date, end_date)
+    # 使用周报逻辑（复用代码），内容在内存中改为月报后只保存一次
+    result, report_content = _build_report(start_date, end_date)
     
-    # 重新保存为月报文件名
     filename = NamingConfig.MONTHLY_REPORT_NAME.format(year=year, month=month)
     report_path = report_generator.save_report(
-        open(result["report_path"]).read().replace("周报", "月报"),
+        report_content.replace("周报", "月报"),
         filename
     )
     
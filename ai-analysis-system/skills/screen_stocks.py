@@ -6,18 +6,19 @@ AI信息分析系统 - 股票筛选技能
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:  # 避免重复导入时反复插入
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from core import (
     file_manager,
-    content_parser,
-    news_analyzer,
     stock_screener,
     report_generator,
     NamingConfig,
+    analyze_all,
     AnalysisResult,
     StockRecommendation,
 )
@@ -44,38 +45,12 @@ def screen_stocks(
     if date is None:
         date = datetime.now().strftime(NamingConfig.DATE_FORMAT)
     
-    # 获取processing中的分析结果文件
-    processing_files = file_manager.get_files_by_date(date, "processing")
-    
-    # 如果没有当日分析结果，先进行分析
-    if not processing_files:
-        from .analyze_news import analyze_news
-        analyze_result = analyze_news(date)
-        
-        if analyze_result["files_processed"] == 0:
-            return {
-                "date": date,
-                "recommendations": [],
-                "message": "没有足够的数据进行股票筛选",
-            }
-    
-    # 重新获取所有待处理的原始文件进行分析
-    input_files = file_manager.get_pending_files()
-    
-    analysis_results: List[AnalysisResult] = []
-    for file_path in input_files:
-        try:
-            parsed = content_parser.parse_file(file_path)
-            result = news_analyzer.analyze(parsed)
-            analysis_results.append(result)
-        except Exception as e:
-            print(f"处理 {file_path} 时出错: {e}")
-    
+    analysis_results, message = _collect_analysis_results(date)
     if not analysis_results:
         return {
             "date": date,
             "recommendations": [],
-            "message": "没有可分析的内容",
+            "message": message,
         }
     
     # 配置筛选器
@@ -107,33 +82,87 @@ def screen_stocks(
     return {
         "date": date,
         "total_recommendations": len(recommendations),
-        "recommendations": [
-            {
-                "code": r.code,
-                "name": r.name,
-                "level": r.recommendation_level,
-                "score": r.recommendation_score,
-                "industries": r.related_industries,
-            }
-            for r in recommendations
-        ],
+        "recommendations": _to_dicts(recommendations),
         "report_path": str(report_path),
         "message": f"筛选出 {len(recommendations)} 只推荐股票",
     }
 
 
-def get_top_picks(n: int = 5) -> List[dict]:
+def get_top_picks(
+    n: int = 5,
+    min_mentions: int = 2,
+    sentiment_threshold: float = 0.6
+) -> List[dict]:
     """
     获取今日最佳推荐
     
+    只构建排名前N的推荐结果，不生成筛选报告，当日的完整筛选报告
+    仍由screen_stocks负责。
+    
     Args:
         n: 返回数量
+        min_mentions: 最小提及次数
+        sentiment_threshold: 情感分数阈值
         
     Returns:
         推荐股票列表
     """
-    result = screen_stocks()
-    return result.get("recommendations", [])[:n]
+    date = datetime.now().strftime(NamingConfig.DATE_FORMAT)
+    analysis_results, _ = _collect_analysis_results(date)
+    if not analysis_results:
+        return []
+    
+    stock_screener.config.MIN_MENTION_COUNT = min_mentions
+    stock_screener.config.SENTIMENT_THRESHOLD = sentiment_threshold
+    
+    return _to_dicts(stock_screener.screen(analysis_results, top_k=n))
+
+
+def _collect_analysis_results(
+    date: str
+) -> Tuple[List[AnalysisResult], Optional[str]]:
+    """
+    获取用于筛选的分析结果，当日尚未分析时先进行分析
+    
+    Args:
+        date: 筛选日期
+        
+    Returns:
+        (分析结果列表, 结果为空时的提示信息)
+    """
+    # 获取processing中的分析结果文件
+    processing_files = file_manager.get_files_by_date(date, "processing")
+    
+    # 如果没有当日分析结果，先进行分析
+    if not processing_files:
+        from .analyze_news import analyze_news
+        analyze_result = analyze_news(date)
+        
+        if analyze_result["files_processed"] == 0:
+            return [], "没有足够的数据进行股票筛选"
+    
+    # 重新获取所有待处理的原始文件进行分析，
+    # analyze_news刚分析过的文件直接复用批量分析的缓存结果
+    input_files = file_manager.get_pending_files()
+    
+    analysis_results = analyze_all(input_files)
+    if not analysis_results:
+        return [], "没有可分析的内容"
+    return analysis_results, None
+
+
+def _to_dicts(recommendations: List[StockRecommendation]) -> List[dict]:
+    """将推荐结果转为返回给调用方的字典"""
+    return [
+        {
+            "code": r.code,
+            "name": r.name,
+            "level": r.recommendation_level,
+            "score": r.recommendation_score,
+            "industries": r.related_industries,
+        }
+        for r in recommendations
+    ]
 
 
 if __name__ == "__main__":
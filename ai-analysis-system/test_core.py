@@ -0,0 +1,362 @@
+import errno
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from collections import OrderedDict
+
+from core import batch, keyword_matcher
+from core.analyzer import AnalysisResult, NewsAnalyzer, news_analyzer
+from core.batch import analyze_all, analyze_files
+from core.config import BatchConfig, INPUT_DIR, StockScreenerConfig
+from core.content_parser import ContentParser
+from core.file_manager import FileManager
+from core.keyword_matcher import KeywordMatcher
+from core.stock_screener import StockScreener
+
+
+def _brute_force(keywords, content):
+    """逐个起点逐个关键词比较的参考实现"""
+    hits = []
+    for start in range(len(content)):
+        for kw in keywords:
+            if content.startswith(kw, start):
+                hits.append((start + len(kw) - 1, kw))
+    return sorted(hits)
+
+
+class TestKeywordMatcherFallback(unittest.TestCase):
+
+    def setUp(self):
+        # 强制走未安装pyahocorasick时的正则实现
+        patcher = mock.patch.object(keyword_matcher, 'ahocorasick', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_overlapping_and_prefix_keywords(self):
+        keywords = ['上涨', '上涨趋势', '涨', '趋势', '涨涨']
+        matcher = KeywordMatcher(keywords)
+        self.assertIsNone(matcher._automaton)
+
+        for content in ['', '上涨', '大盘上涨趋势明显', '涨涨涨上涨上涨趋势',
+                        '上上涨趋趋势', '下跌', '涨']:
+            expected = _brute_force(keywords, content)
+            self.assertEqual(sorted(matcher.iter(content)), expected)
+            self.assertEqual(matcher.find(content), {kw for _, kw in expected})
+
+    def test_duplicate_and_empty_keywords(self):
+        matcher = KeywordMatcher(['涨', '', '涨', '上涨'])
+        self.assertEqual(matcher.keywords, ('涨', '上涨'))
+        self.assertEqual(sorted(matcher.iter('上涨')), [(1, '上涨'), (1, '涨')])
+
+    def test_no_keywords(self):
+        matcher = KeywordMatcher([])
+        self.assertEqual(list(matcher.iter('上涨')), [])
+        self.assertEqual(matcher.find('上涨'), set())
+
+
+class TestParseFiles(unittest.TestCase):
+
+    def test_matches_parse_file(self):
+        file_paths = sorted(INPUT_DIR.glob('*.md'))
+        self.assertTrue(file_paths)
+
+        parser = ContentParser()
+        self.assertEqual(
+            parser.parse_files(file_paths),
+            [parser.parse_file(p) for p in file_paths]
+        )
+
+    def test_matches_parse_file_without_ahocorasick(self):
+        with mock.patch.object(keyword_matcher, 'ahocorasick', None):
+            matcher = KeywordMatcher(ContentParser.INDUSTRY_KEYWORDS)
+        file_paths = sorted(INPUT_DIR.glob('*.md'))
+
+        with mock.patch.object(ContentParser, '_industry_matcher', matcher):
+            parser = ContentParser()
+            self.assertEqual(
+                parser.parse_files(file_paths),
+                [parser.parse_file(p) for p in file_paths]
+            )
+
+    def test_empty(self):
+        self.assertEqual(ContentParser().parse_files([]), [])
+
+    def test_stock_codes_single_and_batch_agree(self):
+        # STOCK_CODE_PATTERN的\d同样匹配全角等Unicode数字
+        content = "代码6０００１９和600519，再次提到600519"
+        parser = ContentParser()
+        self.assertEqual(
+            parser.parse_content(content).stocks_mentioned,
+            ["6０００１９", "600519"]
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "2026-01-05-a.md"
+            path.write_text(content, encoding="utf-8")
+            self.assertEqual(
+                parser.parse_files([path]), [parser.parse_file(path)]
+            )
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(batch, '_result_cache', OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_import_does_not_load_process_pool(self):
+        code = (
+            "import sys; import core; "
+            "print('concurrent.futures.process' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_parallel_matches_serial(self):
+        file_paths = sorted(INPUT_DIR.glob('*.md'))
+        parser = ContentParser()
+        expected = [
+            news_analyzer.analyze(parser.parse_file(p)) for p in file_paths
+        ]
+
+        with mock.patch.object(BatchConfig, 'PARALLEL_THRESHOLD', 1), \
+                mock.patch.object(BatchConfig, 'CHUNK_SIZE', 2):
+            self.assertEqual(analyze_all(file_paths, max_workers=2), expected)
+
+
+class TestImportanceBound(unittest.TestCase):
+
+    def _random_document(self, rng):
+        """随机拼接情感、类别关键词、股票代码和无关文字"""
+        words = (
+            NewsAnalyzer.POSITIVE_KEYWORDS
+            + NewsAnalyzer.NEGATIVE_KEYWORDS
+            + [kw for kws in NewsAnalyzer.CATEGORY_KEYWORDS.values()
+               for kw in kws]
+            + ["今天", "公司", "表示", "。", "，", "\n"]
+        )
+        codes = [f"{rng.choice('036')}{rng.randrange(10 ** 5):05d}"
+                 for _ in range(rng.randrange(5))]
+        parts = rng.choices(words, k=rng.randrange(40)) + codes
+        rng.shuffle(parts)
+        return "# 标题\n\n" + "".join(parts)
+
+    def test_bound_never_excludes_actual_level(self):
+        rng = random.Random(20260105)
+        parser = ContentParser()
+        analyzer = NewsAnalyzer()
+        for _ in range(3000):
+            parsed = parser.parse_content(self._random_document(rng))
+            actual = analyzer.analyze(parsed).importance
+            self.assertTrue(
+                analyzer.may_have_importance(parsed, actual), parsed.content
+            )
+
+    def test_analyze_files_skips_only_unreachable_files(self):
+        rng = random.Random(42)
+        parser = ContentParser()
+        with tempfile.TemporaryDirectory() as tmp:
+            file_paths = []
+            for i in range(60):
+                path = Path(tmp) / f"2026-01-05-{i:02d}.md"
+                path.write_text(self._random_document(rng), encoding="utf-8")
+                file_paths.append(path)
+
+            with mock.patch.object(batch, '_result_cache', OrderedDict()):
+                results = analyze_files(file_paths, importance="high")
+
+            skipped = 0
+            for path, result in zip(file_paths, results):
+                parsed = parser.parse_file(path)
+                if result is None:
+                    skipped += 1
+                    self.assertFalse(
+                        news_analyzer.may_have_importance(parsed, "high")
+                    )
+                else:
+                    self.assertEqual(result, news_analyzer.analyze(parsed))
+            self.assertTrue(0 < skipped < len(file_paths))
+
+
+class TestStockScreener(unittest.TestCase):
+
+    def test_top_k_matches_sorted_prefix(self):
+        config = StockScreenerConfig()
+        config.MIN_MENTION_COUNT = 1
+        config.SENTIMENT_THRESHOLD = 0.0
+        screener = StockScreener(config)
+
+        results = analyze_all(sorted(INPUT_DIR.glob('*.md')))
+        full = screener.screen(results)
+        self.assertTrue(full)
+        # 同分股票较多，前K只的顺序也须与完整排序一致
+        for k in range(len(full) + 2):
+            self.assertEqual(screener.screen(results, top_k=k), full[:k])
+
+    def _result(self, code, industries):
+        return AnalysisResult(
+            summary="摘要",
+            sentiment="positive",
+            sentiment_score=1.0,
+            key_points=[],
+            related_stocks=[{"code": code, "name": code, "market": "SH"}],
+            related_industries=industries,
+            category="",
+            importance="low",
+        )
+
+    def test_focus_industries_follow_config_changes(self):
+        config = StockScreenerConfig()
+        config.MIN_MENTION_COUNT = 1
+        config.FOCUS_INDUSTRIES = []
+        screener = StockScreener(config)
+        results = [self._result("600519", ["白酒"])]
+        self.assertEqual(screener.screen(results)[0].recommendation_score, 50.0)
+
+        # 配置被原地修改后，下一次筛选即按新的关注行业评分
+        config.FOCUS_INDUSTRIES.append("白酒")
+        self.assertEqual(screener.screen(results)[0].recommendation_score, 60.0)
+
+    def test_screen_is_reentrant(self):
+        config = StockScreenerConfig()
+        config.MIN_MENTION_COUNT = 1
+        screener = StockScreener(config)
+        outer = [self._result("600519", ["消费"])]
+        inner = [self._result("000001", ["金融"])]
+        expected = screener.screen(outer)
+
+        # 评分途中再次调用screen（如另一线程共用模块级实例），
+        # 内层调用不应影响外层正在使用的关注行业表
+        score_stock = StockScreener._score_stock
+        nested = []
+
+        def score_with_nested_screen(self, *args):
+            if not nested:
+                nested.append(None)
+                nested[0] = self.screen(inner)
+            return score_stock(self, *args)
+
+        with mock.patch.object(
+            StockScreener, "_score_stock", score_with_nested_screen
+        ):
+            self.assertEqual(screener.screen(outer), expected)
+        self.assertEqual(nested[0][0].code, "000001")
+
+
+class TestFileManagerListing(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.manager = FileManager()
+        self.manager.processing_dir = Path(tmp.name)
+
+    def _save_keeping_mtime(self, filename):
+        # 模拟目录修改时间精度不足：写入后目录mtime不变
+        directory = self.manager.processing_dir
+        stat = os.stat(directory)
+        path = self.manager.save_to_processing("内容", filename)
+        os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        return path
+
+    def test_save_invalidates_listing(self):
+        self._save_keeping_mtime("2026-01-05-a.md")
+        self.assertEqual(
+            len(self.manager.get_files_by_date("2026-01-05", "processing")), 1
+        )
+        self._save_keeping_mtime("2026-01-05-b.md")
+        self.assertEqual(
+            len(self.manager.get_files_by_date("2026-01-05", "processing")), 2
+        )
+
+    def test_move_to_archive_invalidates_listing(self):
+        path = self._save_keeping_mtime("2026-01-05-a.md")
+        self.assertEqual(
+            len(self.manager.get_files_by_date("2026-01-05", "processing")), 1
+        )
+        stat = os.stat(self.manager.processing_dir)
+        self.manager.move_to_archive(path)
+        os.utime(
+            self.manager.processing_dir,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns)
+        )
+        self.assertEqual(
+            self.manager.get_files_by_date("2026-01-05", "processing"), []
+        )
+
+
+class TestFileManagerRead(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.manager = FileManager()
+
+    def test_reads_text_and_normalizes_newlines(self):
+        path = self.dir / "a.md"
+        path.write_bytes("第一行\r\n第二行\r第三行\n".encode("utf-8"))
+        self.assertEqual(self.manager.read_file(path), "第一行\n第二行\n第三行\n")
+
+    def test_empty_file(self):
+        path = self.dir / "empty.md"
+        path.write_bytes(b"")
+        self.assertEqual(self.manager.read_file(path), "")
+
+    def test_invalid_utf8_raises(self):
+        path = self.dir / "bad.md"
+        path.write_bytes(b"\xff\xfe")
+        with self.assertRaises(UnicodeDecodeError):
+            self.manager.read_file(path)
+
+
+class TestFileManagerArchive(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.manager = FileManager()
+        self.manager.processing_dir = Path(tmp.name)
+
+    def test_missing_source_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.manager.move_to_archive(
+                self.manager.processing_dir / "missing.md"
+            )
+
+    def test_cross_device_falls_back_to_copy(self):
+        path = self.manager.save_to_processing("内容", "a.md")
+        cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+        with mock.patch("os.replace", side_effect=cross_device):
+            dest = self.manager.move_to_archive(path)
+        self.assertFalse(path.exists())
+        self.assertEqual(dest.read_text(encoding="utf-8"), "内容")
+
+    def test_other_errors_are_not_retried(self):
+        path = self.manager.save_to_processing("内容", "a.md")
+        denied = PermissionError(errno.EACCES, "Permission denied")
+        with mock.patch("os.replace", side_effect=denied), \
+                mock.patch("shutil.move") as move:
+            with self.assertRaises(PermissionError):
+                self.manager.move_to_archive(path)
+        move.assert_not_called()
+        self.assertTrue(path.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import skills
+from core import file_manager, report_generator, stock_screener
+
+
+class _TempDirsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # processing/output指向临时目录，避免写入项目目录
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        tmp_path = Path(tmp.name)
+        for name in ("processing", "output"):
+            (tmp_path / name).mkdir()
+
+        for target, attr, value in [
+            (file_manager, "processing_dir", tmp_path / "processing"),
+            (file_manager, "output_dir", tmp_path / "output"),
+            (report_generator, "output_dir", tmp_path / "processing"),
+            (stock_screener, "config", type(stock_screener.config)()),
+        ]:
+            patcher = mock.patch.object(target, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.processing_dir = tmp_path / "processing"
+
+
+class TestSkillExports(_TempDirsTestCase):
+
+    def test_exports_are_callable(self):
+        for name in skills.__all__:
+            self.assertTrue(callable(getattr(skills, name)), name)
+
+    def test_analyze_news_callable_after_screen_stocks(self):
+        # processing为空时screen_stocks会在内部导入analyze_news子模块
+        result = skills.screen_stocks("2026-01-05")
+        self.assertIn("recommendations", result)
+
+        self.assertTrue(callable(skills.analyze_news))
+        from skills import analyze_news, screen_stocks
+        self.assertTrue(callable(analyze_news))
+        self.assertTrue(callable(screen_stocks))
+
+
+class TestScreenStocks(_TempDirsTestCase):
+
+    def test_get_top_picks_keeps_screening_report(self):
+        result = skills.screen_stocks(min_mentions=1, sentiment_threshold=0.0)
+        self.assertGreater(result["total_recommendations"], 1)
+        report_path = Path(result["report_path"])
+        report = report_path.read_text(encoding="utf-8")
+
+        picks = skills.get_top_picks(1, min_mentions=1, sentiment_threshold=0.0)
+
+        # 只返回前N只，当日完整的筛选报告保持不变
+        self.assertEqual(picks, result["recommendations"][:1])
+        self.assertEqual(report_path.read_text(encoding="utf-8"), report)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,14 @@
+from bisect import bisect_left
 from typing import List, Optional, TypeVar
 
 T = TypeVar('T', int, float)
 
 
+def _is_ndarray(arr) -> bool:
+    # Checked by type name so that importing this module never imports numpy
+    return type(arr).__name__ == "ndarray" and type(arr).__module__ == "numpy"
+
+
 def binary_search(arr: List[T], target: T) -> int:
     """
     Performs binary search on a sorted list to find the index of a target value.
@@ -13,23 +19,47 @@ def binary_search(arr: List[T], target: T) -> int:
 
     Returns:
         int: The index of the target element if found, otherwise -1.
+            If the target occurs more than once, the first index is returned.
     """
-    left = 0
-    right = len(arr) - 1
-
-    while left <= right:
-        mid = (left + right) // 2
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
+    if _is_ndarray(arr):
+        # Vectorized search in C for large numeric arrays
+        index = int(arr.searchsorted(target))
+        if index < len(arr) and arr[index] == target:
+            return index
+        return -1
 
+    # bisect runs the search loop in C
+    index = bisect_left(arr, target)
+    if index < len(arr) and arr[index] == target:
+        return index
     return -1
 
 
 def bubble_sort(arr: List[T]) -> List[T]:
+    """
+    Sorts a list of elements in ascending order (stable sort).
+    This function returns a new sorted list and leaves the original list unchanged.
+
+    Delegates to the built-in Timsort, which runs in C and handles
+    already-sorted or reversed input in linear time. The original bubble
+    sort is kept as ``_bubble_sort_reference``.
+
+    Args:
+        arr (List[T]): A list of elements to be sorted.
+
+    Returns:
+        List[T]: A new list containing the sorted elements. A NumPy array
+            input gives a new sorted array of the same dtype instead.
+    """
+    if _is_ndarray(arr):
+        # Sort a copy of the typed buffer directly instead of boxing every element
+        sorted_arr = arr.copy()
+        sorted_arr.sort(kind="stable")
+        return sorted_arr
+    return sorted(arr)
+
+
+def _bubble_sort_reference(arr: List[T]) -> List[T]:
     """
     Sorts a list of elements using the bubble sort algorithm.
     This function returns a new sorted list and leaves the original list unchanged.
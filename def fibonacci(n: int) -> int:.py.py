@@ -1,11 +1,21 @@
 def fibonacci(n: int) -> int:
-    """Calculates the nth Fibonacci number using an iterative approach."""
+    """Calculates the nth Fibonacci number using fast doubling.
+
+    Walks the bits of n from the most significant end, using
+    F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2,
+    so only O(log n) big-integer multiplications are needed.
+    """
     if n < 0:
         raise ValueError("n must be a non-negative integer")
     if n == 0:
         return 0
     
-    a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
+    a, b = 0, 1  # F(k), F(k+1) with k = 0
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
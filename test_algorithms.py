@@ -1,5 +1,13 @@
+import os
+import subprocess
+import sys
 import unittest
-from algorithms import binary_search, bubble_sort
+from algorithms import binary_search, bubble_sort, _bubble_sort_reference
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
 
 class TestAlgorithms(unittest.TestCase):
 
@@ -21,6 +29,10 @@ class TestAlgorithms(unittest.TestCase):
         self.assertEqual(binary_search([5], 5), 0)
         self.assertEqual(binary_search([5], 1), -1)
 
+    def test_binary_search_duplicates(self):
+        arr = [1, 2, 2, 2, 3]
+        self.assertEqual(binary_search(arr, 2), 1)
+
     def test_bubble_sort_unsorted(self):
         arr = [64, 34, 25, 12, 22, 11, 90]
         sorted_arr = bubble_sort(arr)
@@ -46,5 +58,38 @@ class TestAlgorithms(unittest.TestCase):
         arr = [3.3, 1.1, 2.2]
         self.assertEqual(bubble_sort(arr), [1.1, 2.2, 3.3])
 
+    def test_bubble_sort_matches_reference(self):
+        arr = [5, 3.5, -2, 3.5, 0, 11, -7.25, 5]
+        self.assertEqual(bubble_sort(arr), _bubble_sort_reference(arr))
+
+    def test_import_does_not_load_numpy(self):
+        code = "import sys, algorithms; print('numpy' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    @unittest.skipUnless(np, "numpy is not installed")
+    def test_binary_search_ndarray(self):
+        arr = np.array([1, 2, 2, 2, 3, 5])
+        self.assertEqual(binary_search(arr, 2), 1)
+        self.assertEqual(binary_search(arr, 5), 5)
+        self.assertEqual(binary_search(arr, 4), -1)
+        self.assertEqual(binary_search(arr, 6), -1)
+        self.assertEqual(binary_search(np.array([]), 1), -1)
+
+    @unittest.skipUnless(np, "numpy is not installed")
+    def test_bubble_sort_ndarray(self):
+        arr = np.array([5, 3.5, -2, 3.5, 0, 11, -7.25, 5])
+        original = arr.copy()
+        sorted_arr = bubble_sort(arr)
+        self.assertIsInstance(sorted_arr, np.ndarray)
+        self.assertEqual(sorted_arr.dtype, arr.dtype)
+        self.assertEqual(sorted_arr.tolist(), _bubble_sort_reference(arr.tolist()))
+        # Ensure original array is not modified
+        self.assertTrue(np.array_equal(arr, original))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,15 +1,47 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 import os
+import sqlite3
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
 
 app = Flask(__name__)
 # Use SQLite for simplicity
 db_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'todos.db')
-app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+# TODO_DATABASE_URI points the app at another database (e.g. in tests)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+    'TODO_DATABASE_URI', f'sqlite:///{db_path}'
+)
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Keep a pool of open connections so requests reuse them (and their
+# PRAGMAs) instead of reconnecting; with WAL, readers on separate
+# connections run alongside a writer, and timeout waits out write locks
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'connect_args': {'check_same_thread': False, 'timeout': 30},
+    'poolclass': QueuePool,
+    'pool_size': 5,
+}
 
 db = SQLAlchemy(app)
 
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    # WAL journaling avoids an fsync per commit and lets reads run during writes
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 # Database Model
 class Todo(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -32,10 +64,49 @@ with app.app_context():
 def index():
     return render_template('index.html')
 
+# Upper bound for ?limit= on paginated listings
+MAX_PAGE_SIZE = 100
+
 @app.route('/api/todos', methods=['GET'])
 def get_todos():
-    todos = Todo.query.order_by(Todo.id.desc()).all()
-    return jsonify([todo.to_dict() for todo in todos])
+    # Keyset pagination is opt-in: without ?before_id / ?limit the full
+    # list is returned as a plain array, as before
+    before_id = request.args.get('before_id', type=int)
+    limit = request.args.get('limit', type=int)
+    for name, value in (('before_id', before_id), ('limit', limit)):
+        # type=int yields None for unparseable values; reject them rather
+        # than silently returning the unpaginated list
+        if value is None and name in request.args:
+            return jsonify({'error': f'{name} must be an integer'}), 400
+    if limit is not None and limit < 1:
+        return jsonify({'error': 'limit must be at least 1'}), 400
+    paginated = before_id is not None or limit is not None
+
+    # Select plain columns to skip ORM object hydration
+    query = db.session.query(Todo.id, Todo.content, Todo.completed)
+    if before_id is not None:
+        query = query.filter(Todo.id < before_id)
+    query = query.order_by(Todo.id.desc())
+    if paginated:
+        limit = min(limit if limit is not None else MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+        query = query.limit(limit)
+
+    todos = [
+        {'id': id, 'content': content, 'completed': completed}
+        for id, content, completed in query
+    ]
+    if not paginated:
+        return _json_response(todos)
+
+    # A short page means there is nothing older left to fetch
+    next_before_id = todos[-1]['id'] if len(todos) == limit else None
+    return _json_response({'items': todos, 'next_before_id': next_before_id})
+
+def _json_response(payload):
+    if orjson is not None:
+        # orjson encodes straight to bytes in C
+        return Response(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
 
 @app.route('/api/todos', methods=['POST'])
 def create_todo():
@@ -69,4 +140,13 @@ def delete_todo(id):
     return jsonify({'result': 'success'})
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    if os.environ.get('FLASK_ENV') == 'development':
+        # Reloader and interactive debugger, for local development only
+        app.run(debug=True, port=5000)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:  # optional dependency
+            app.run(port=5000)
+        else:
+            serve(app, host='127.0.0.1', port=5000, threads=8)
@@ -0,0 +1,86 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import flask_sqlalchemy
+except ImportError:  # optional dependency for running these tests
+    flask_sqlalchemy = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+@unittest.skipUnless(flask_sqlalchemy, "flask_sqlalchemy is not installed")
+class TestTodoPagination(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Use a throwaway database instead of the tracked todos.db
+        cls.tmp = tempfile.TemporaryDirectory()
+        os.environ['TODO_DATABASE_URI'] = (
+            'sqlite:///' + os.path.join(cls.tmp.name, 'todos.db')
+        )
+        import app
+        cls.app = app
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app.app_context():
+            cls.app.db.engine.dispose()
+        del os.environ['TODO_DATABASE_URI']
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        with self.app.app.app_context():
+            self.app.db.session.query(self.app.Todo).delete()
+            self.app.db.session.commit()
+        self.client = self.app.app.test_client()
+        self.ids = [
+            self.client.post('/api/todos', json={'content': f'todo {i}'})
+            .get_json()['id']
+            for i in range(5)
+        ]
+
+    def test_unpaginated_list(self):
+        response = self.client.get('/api/todos')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [todo['id'] for todo in response.get_json()], self.ids[::-1]
+        )
+
+    def test_cursor_walks_all_pages(self):
+        seen = []
+        url = '/api/todos?limit=2'
+        while True:
+            page = self.client.get(url).get_json()
+            seen.extend(todo['id'] for todo in page['items'])
+            if page['next_before_id'] is None:
+                break
+            url = f"/api/todos?limit=2&before_id={page['next_before_id']}"
+        self.assertEqual(seen, self.ids[::-1])
+
+    def test_before_id_alone_uses_max_page_size(self):
+        page = self.client.get(f'/api/todos?before_id={self.ids[2]}').get_json()
+        self.assertEqual(
+            [todo['id'] for todo in page['items']], self.ids[1::-1]
+        )
+        self.assertIsNone(page['next_before_id'])
+
+    def test_limit_clamped_to_max_page_size(self):
+        with mock.patch.object(self.app, 'MAX_PAGE_SIZE', 3):
+            page = self.client.get('/api/todos?limit=500').get_json()
+        self.assertEqual(len(page['items']), 3)
+        self.assertEqual(page['next_before_id'], self.ids[2])
+
+    def test_invalid_arguments_rejected(self):
+        for query in ['before_id=abc', 'before_id=', 'limit=x',
+                      'limit=0', 'limit=-3']:
+            response = self.client.get(f'/api/todos?{query}')
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn('error', response.get_json())
+
+
+if __name__ == '__main__':
+    unittest.main()